@@ -3,13 +3,20 @@ import re
 import json
 import logging
 import threading
-from datetime import datetime, timedelta
+import atexit
+import contextlib
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
+import orjson
 import requests
-import schedule
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-import pytz
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -25,6 +32,15 @@ AFFINITY_API_KEY = os.environ.get("AFFINITY_API_KEY")
 AFFINITY_LIST_ID = os.environ.get("AFFINITY_LIST_ID")
 NUDGE_CHANNEL_ID = os.environ.get("NUDGE_CHANNEL_ID")  # #deal-nudges channel ID
 BRAVE_SEARCH_API_KEY = os.environ.get("BRAVE_SEARCH_API_KEY")
+# Seconds to reuse a list's stage field + dropdown options before re-fetching
+# them from Affinity. The list schema almost never changes, so every message
+# doesn't need to pay for the round-trip.
+AFFINITY_SCHEMA_TTL = float(os.environ.get("AFFINITY_SCHEMA_TTL", "300"))
+# The resolved stage schema is also written here so a restart within the TTL
+# (crash loop, redeploy) doesn't have to relearn it from Affinity.
+AFFINITY_SCHEMA_CACHE_PATH = os.path.expanduser(
+    os.environ.get("AFFINITY_SCHEMA_CACHE_PATH", "~/.cache/dealflow/stage_schema.json")
+)
 
 # Owner name to Slack ID mapping
 OWNER_SLACK_MAP = {
@@ -42,6 +58,17 @@ SLACK_TO_AFFINITY_PERSON = {
     "U08840SFVN1": 217635950,   # Leila Pirbay
 }
 
+# Affinity Person ID to name, so known owners never need a /persons lookup
+AFFINITY_PERSON_TO_NAME = {
+    SLACK_TO_AFFINITY_PERSON[slack_id]: name
+    for name, slack_id in OWNER_SLACK_MAP.items()
+    if slack_id in SLACK_TO_AFFINITY_PERSON
+}
+# Affinity Person ID to Slack ID, for tagging owners in nudges
+AFFINITY_PERSON_TO_SLACK = {
+    person_id: slack_id for slack_id, person_id in SLACK_TO_AFFINITY_PERSON.items()
+}
+
 # Stage nudge thresholds (in days)
 STAGE_THRESHOLDS = {
     "First Meeting": 14,   # 2 weeks
@@ -60,6 +87,8 @@ STEALTH_STATUS_VALUE_ID = None  # TODO: set to the Stealth dropdown ID
 OWNERS_FIELD_ID = 4927712
 PASS_REASON_FIELD_ID = 4944316
 MISSED_STATUS_VALUE_ID = 20689035
+# Lowercased list-field names that get_stage_name treats as the stage field
+STAGE_FIELD_NAMES = frozenset({"stage", "status", "deal stage"})
 
 # Overture sector keywords — used to rank candidate websites found via search.
 # Matched case-insensitively against candidate homepage text.
@@ -180,9 +209,150 @@ VC_FIRM_KEYWORDS = {
 # Minimum characters in a no-URL message before we trigger the URL-search poll
 MIN_POLL_MESSAGE_LENGTH = 3
 
-app = App(token=SLACK_BOT_TOKEN)
+# Listeners are synchronous and spend most of their time waiting on Affinity,
+# Brave and homepage fetches. Bolt's default pool of 5 workers lets a handful
+# of slow URL polls stall every other message, so give it more headroom.
+SLACK_LISTENER_WORKERS = int(os.environ.get("SLACK_LISTENER_WORKERS", "20"))
+
+app = App(
+    token=SLACK_BOT_TOKEN,
+    listener_executor=ThreadPoolExecutor(
+        max_workers=SLACK_LISTENER_WORKERS, thread_name_prefix="bolt-listener"
+    ),
+)
+# Slack throttles chat.postMessage per channel. Honor Retry-After on a 429
+# and resend, rather than dropping the message (e.g. a burst of nudges).
+app.client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=2))
 
 AFFINITY_BASE_URL = "https://api.affinity.co"
+# Cap on simultaneous in-flight Affinity requests across all threads, so the
+# nudge fan-out plus live messages stay under Affinity's concurrency limit.
+AFFINITY_MAX_CONCURRENCY = int(os.environ.get("AFFINITY_MAX_CONCURRENCY", "16"))
+# Every Affinity call goes to the same host, so one keep-alive pool is shared
+# by all threads. One connection per in-flight slot means a request that got
+# past the cap never waits on the pool or opens a throwaway connection.
+AFFINITY_POOL_SIZE = AFFINITY_MAX_CONCURRENCY
+AFFINITY_TIMEOUT = 30  # seconds
+# Client-side request budget, kept under Affinity's rate limit so bursts are
+# spread out up front instead of bouncing off 429s and backing off.
+AFFINITY_RATE_LIMIT = float(os.environ.get("AFFINITY_RATE_LIMIT", "10"))  # req/s
+# Tokens background work (the nudge sweep) must leave in the bucket, so live
+# message lookups don't queue behind the sweep for their share of the budget.
+AFFINITY_LIVE_RESERVE = 3
+# How many times a 429'd request is re-issued after the pause it triggered
+AFFINITY_THROTTLE_RETRIES = 3
+# Kept well below both the rate limit and AFFINITY_MAX_CONCURRENCY: the sweep
+# can't use more than the bucket allows anyway, and live traffic keeps free
+# concurrency slots while it runs.
+NUDGE_FETCH_WORKERS = 4
+
+# Transient Affinity failures (gateway hiccups) are retried on the pooled
+# connection with backoff instead of surfacing as a Slack error. GETs are
+# retried on any of these statuses; POSTs only on a 503 that carries
+# Retry-After, where Affinity can't have applied the write. A POST that hit
+# any other 5xx may already have gone through, and replaying
+# create_organization would duplicate the org.
+# 429s are deliberately not retried here: AffinityClient._send handles them,
+# pausing the shared rate limiter so every thread backs off together.
+# raise_on_status=False hands the last response back so raise_for_status()
+# still raises the usual HTTPError once retries run out.
+class _AffinityRetry(Retry):
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if status_code == 429:
+            # urllib3 would otherwise retry any 429 carrying Retry-After
+            return False
+        if method and method.upper() == "POST" and status_code == 503 and has_retry_after:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+AFFINITY_RETRY = _AffinityRetry(
+    total=5,
+    backoff_factor=0.3,
+    status_forcelist=[500, 502, 503, 504],
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+
+class _TTLCache:
+    """Small thread-safe dict with per-entry expiry.
+
+    Bolt runs listeners on a worker pool, so reads and writes can race. When
+    full, the oldest insert is evicted first.
+    """
+
+    def __init__(self, ttl, maxsize=256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value, or None if missing/expired."""
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return None
+            expires_at, value = hit
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                self._data.pop(next(iter(self._data)))
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket allowing `rate` calls per second.
+
+    acquire() blocks until a token is available; with `reserve` it waits
+    until that many tokens would still be left over, which lets low-priority
+    callers yield to everyone else. pause() holds every caller for a while,
+    e.g. for the Retry-After on a 429.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, reserve=0):
+        # A reserve the bucket can never hold would starve the caller.
+        need = 1 + min(reserve, self.capacity - 1)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    elapsed = now - self._updated
+                    self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                    self._updated = now
+                    if self._tokens >= need:
+                        self._tokens -= 1
+                        return
+                    wait = (need - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+            self._updated = self._paused_until
 
 
 class AffinityClient:
@@ -191,41 +361,121 @@ class AffinityClient:
         self.session = requests.Session()
         self.session.auth = ("", api_key)
         self.session.headers.update({"Content-Type": "application/json"})
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=AFFINITY_POOL_SIZE,
+            max_retries=AFFINITY_RETRY,
+        )
+        self.session.mount("https://", adapter)
+        atexit.register(self.session.close)
+        self._slots = threading.BoundedSemaphore(AFFINITY_MAX_CONCURRENCY)
+        self._bucket = _TokenBucket(AFFINITY_RATE_LIMIT)
+        self._local = threading.local()
+        # List field definitions rarely change; keep them for
+        # AFFINITY_SCHEMA_TTL seconds instead of refetching per message.
+        self._fields_cache = _TTLCache(ttl=AFFINITY_SCHEMA_TTL, maxsize=8)
+
+    def _get(self, path, **kwargs):
+        return self._send("GET", path, **kwargs)
+
+    def _post(self, path, **kwargs):
+        if "json" in kwargs:
+            # Encode the body with orjson; the session already sends
+            # Content-Type: application/json.
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"))
+        return self._send("POST", path, **kwargs)
+
+    def _send(self, method, path, **kwargs):
+        """Issue a request under the rate limit and concurrency cap.
+
+        429s are handled here rather than by urllib3: the first one pauses
+        the shared bucket for the Retry-After, so every thread backs off, and
+        the request is re-issued (up to AFFINITY_THROTTLE_RETRIES times) once
+        the pause ends. The slot is released while waiting.
+        """
+        kwargs.setdefault("timeout", AFFINITY_TIMEOUT)
+        url = f"{AFFINITY_BASE_URL}{path}"
+        for _ in range(AFFINITY_THROTTLE_RETRIES + 1):
+            # acquire() also waits out any pause set by a 429.
+            if getattr(self._local, "background", False):
+                self._bucket.acquire(reserve=AFFINITY_LIVE_RESERVE)
+            else:
+                self._bucket.acquire()
+            with self._slots:
+                response = self.session.request(method, url, **kwargs)
+            if response.status_code != 429:
+                return response
+            self._check_throttle(response)
+        return response
+
+    @contextlib.contextmanager
+    def background(self):
+        """Mark this thread's requests as low priority while in the block."""
+        previous = getattr(self._local, "background", False)
+        self._local.background = True
+        try:
+            yield
+        finally:
+            self._local.background = previous
+
+    def _check_throttle(self, response):
+        """Back every thread off for a 429's Retry-After."""
+        try:
+            delay = float(response.headers.get("Retry-After", 1))
+        except ValueError:
+            delay = 1.0
+        logger.warning(f"Affinity rate limited; pausing requests for {delay}s")
+        self._bucket.pause(delay)
+
+    @staticmethod
+    def _json(response):
+        # orjson parses the larger payloads (list entries, field values)
+        # several times faster than the stdlib decoder behind response.json().
+        return orjson.loads(response.content)
 
     def search_organization(self, term):
         """Search for an organization by name or domain."""
-        response = self.session.get(
-            f"{AFFINITY_BASE_URL}/organizations",
+        response = self._get(
+            "/organizations",
             params={"term": term}
         )
         response.raise_for_status()
-        data = response.json()
+        data = self._json(response)
         return data.get("organizations", [])
 
     def get_list_entries(self, list_id):
         """Get all list entries for a list."""
-        response = self.session.get(
-            f"{AFFINITY_BASE_URL}/lists/{list_id}/list-entries"
+        response = self._get(
+            f"/lists/{list_id}/list-entries"
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
 
     def get_field_values(self, organization_id):
         """Get field values for an organization."""
-        response = self.session.get(
-            f"{AFFINITY_BASE_URL}/field-values",
+        response = self._get(
+            "/field-values",
             params={"organization_id": organization_id}
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
 
     def get_list_fields(self, list_id):
-        """Get all fields for a list to find the stage field."""
-        response = self.session.get(
-            f"{AFFINITY_BASE_URL}/lists/{list_id}"
+        """Get all fields for a list to find the stage field (cached)."""
+        fields = self._fields_cache.get(list_id)
+        if fields is not None:
+            return fields
+        response = self._get(
+            f"/lists/{list_id}"
         )
         response.raise_for_status()
-        return response.json().get("fields", [])
+        fields = self._json(response).get("fields", [])
+        self._fields_cache.set(list_id, fields)
+        return fields
+
+    def invalidate_list_fields(self, list_id):
+        """Drop the cached field definitions for a list."""
+        self._fields_cache.pop(list_id)
 
     def create_organization(self, name, domain=None):
         """Create a new organization in Affinity."""
@@ -233,48 +483,48 @@ class AffinityClient:
         if domain:
             data["domain"] = domain
         logger.info(f"Creating organization with data: {data}")
-        response = self.session.post(
-            f"{AFFINITY_BASE_URL}/organizations",
+        response = self._post(
+            "/organizations",
             json=data
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
 
     def add_to_list(self, list_id, organization_id):
         """Add an organization to a list (deal pipeline)."""
         logger.info(f"Adding org {organization_id} to list {list_id}")
-        response = self.session.post(
-            f"{AFFINITY_BASE_URL}/lists/{list_id}/list-entries",
+        response = self._post(
+            f"/lists/{list_id}/list-entries",
             json={"entity_id": organization_id}
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
 
     def get_organization(self, org_id):
         """Get a specific organization by ID."""
-        response = self.session.get(
-            f"{AFFINITY_BASE_URL}/organizations/{org_id}"
+        response = self._get(
+            f"/organizations/{org_id}"
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
 
     def get_field_value_changes(self, field_id):
         """Get field value changes for tracking when stages changed."""
-        response = self.session.get(
-            f"{AFFINITY_BASE_URL}/field-value-changes",
+        response = self._get(
+            "/field-value-changes",
             params={"field_id": field_id}
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
 
     def get_list_entry_field_values(self, list_entry_id):
         """Get field values for a specific list entry."""
-        response = self.session.get(
-            f"{AFFINITY_BASE_URL}/field-values",
+        response = self._get(
+            "/field-values",
             params={"list_entry_id": list_entry_id}
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
 
     def set_field_value(self, field_id, entity_id, list_entry_id, value):
         """Set a field value for a list entry."""
@@ -286,14 +536,14 @@ class AffinityClient:
             "value": value
         }
         logger.info(f"Payload: {payload}")
-        response = self.session.post(
-            f"{AFFINITY_BASE_URL}/field-values",
+        response = self._post(
+            "/field-values",
             json=payload
         )
         if not response.ok:
             logger.error(f"Affinity error response: {response.text}")
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
 
     def create_note(self, organization_id, content):
         """Attach a note to an organization."""
@@ -301,12 +551,12 @@ class AffinityClient:
             "organization_ids": [organization_id],
             "content": content,
         }
-        response = self.session.post(
-            f"{AFFINITY_BASE_URL}/notes",
+        response = self._post(
+            "/notes",
             json=payload
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
 
     def create_person_note(self, person_id, content):
         """Attach a note to a person."""
@@ -314,23 +564,29 @@ class AffinityClient:
             "person_ids": [person_id],
             "content": content,
         }
-        response = self.session.post(
-            f"{AFFINITY_BASE_URL}/notes",
+        response = self._post(
+            "/notes",
             json=payload
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
 
     def search_person(self, term):
         """Search for a person by name or email."""
-        response = self.session.get(
-            f"{AFFINITY_BASE_URL}/persons",
+        response = self._get(
+            "/persons",
             params={"term": term}
         )
         response.raise_for_status()
-        data = response.json()
+        data = self._json(response)
         return data.get("persons", [])
 
+    def get_person(self, person_id):
+        """Get a specific person by ID."""
+        response = self._get(f"/persons/{person_id}")
+        response.raise_for_status()
+        return self._json(response)
+
     def create_person(self, first_name, last_name, emails=None, organization_ids=None):
         """Create a new person in Affinity."""
         data = {
@@ -341,38 +597,90 @@ class AffinityClient:
         if organization_ids:
             data["organization_ids"] = organization_ids
         logger.info(f"Creating person with data: {data}")
-        response = self.session.post(
-            f"{AFFINITY_BASE_URL}/persons",
+        response = self._post(
+            "/persons",
             json=data
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
 
 
 affinity = AffinityClient(AFFINITY_API_KEY)
 
+# Background workers for independent Affinity lookups inside one message, so
+# they overlap on the pooled connections instead of running back to back.
+# Only submit leaf calls here — never code that itself waits on this pool.
+_affinity_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="affinity")
+
+
+# TLDs that mark a bare word as a company domain when there's no full URL.
+_DOMAIN_TLDS = ("com", "io", "co", "ai", "org", "net", "app", "vc", "xyz", "tech", "dev")
+_TLD_ALT = "|".join(_DOMAIN_TLDS)
+
+# Patterns used by extract_company_info on every URL message — compiled once.
+# _COMPANY_DOMAIN_RE finds the URL host or the bare-domain fallback in a single
+# match() call. The leading lazy ".*?" makes the URL branch scan the whole text
+# before the bare-domain branch is tried, so a URL anywhere still wins over an
+# earlier bare domain (same precedence as the old two-search version). The
+# "url" group spans the whole link so it can be sliced out of the name —
+# including Slack's <https://acme.io> / <https://acme.io|label> wrapping, whose
+# "|label>" tail is only consumed when the link opened with "<". An unwrapped
+# link stops short of trailing ")", "]", "," and "." (a balanced "(...)" inside
+# the link is kept) so "(https://acme.com)." leaves its punctuation behind for
+# _CLEAN_RE instead of half of it.
+_COMPANY_DOMAIN_RE = re.compile(
+    r'^(?:.*?(?P<url>(?P<lt><)?https?://(?:www\.)?(?P<urlhost>[a-zA-Z0-9-]+\.[a-zA-Z0-9.-]+)'
+    r'(?(lt)[^\s|>]*(?:\|[^>]*)?>|(?:\([^\s)]*\)|\S)*?(?=[)\],.]*(?:\s|$))))'
+    rf'|.*?\b(?P<bare>[a-zA-Z0-9-]+\.(?:{_TLD_ALT}))\b)',
+    re.DOTALL,
+)
+_PAREN_RE = re.compile(r'\([^)]*\)')
+# Everything extract_company_info drops from the name, in one pass: a leftover
+# scheme from any further links, parenthetical asides, empty brackets and
+# punctuation orphaned by the sliced-out link ("[]", " , "), and missed/filler
+# words.
+_CLEAN_RE = re.compile(
+    r'https?://(?:www\.)?|\([^)]*\)|\[\s*\]|<\s*>|(?<![^\s)\]>])[,.;]+(?=\s|$)'
+    r'|\b(?:miss(?:ed|ing)?|we|this|one|was|a)\b',
+    re.IGNORECASE,
+)
+
+# handle_message routing checks. IGNORECASE spares a text.lower() copy, and
+# the miss/missed/missing alternation is factored onto its shared prefix so
+# the engine tries one literal per position instead of three branches.
+_MISSED_RE = re.compile(r'\bmiss(?:ed|ing)?\b', re.IGNORECASE)
+_URL_IN_MSG_RE = re.compile(r'https?://\S')
+
+# strip_urls / clean_seed_text
+_ANY_URL_RE = re.compile(r'https?://\S+')
+_BARE_DOMAIN_TOKEN_RE = re.compile(rf'\b[a-zA-Z0-9-]+\.(?:{_TLD_ALT})\S*')
+_SEED_NOISE_RE = re.compile(r'\b(?:miss(?:ed|ing)?|we|this|one|was|a|the)\b', re.IGNORECASE)
+_BRACKETS_RE = re.compile(r'[\(\)\[\]<>]')
+
+# Candidate-URL handling: hostname (sans www.), scheme+host root, and the
+# separator used to split hostnames/queries into alphanumeric tokens.
+_URL_HOST_RE = re.compile(r"https?://(?:www\.)?([^/]+)")
+_URL_ROOT_RE = re.compile(r"(https?://[^/]+)")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+# Write-in URL modal: scheme check, and the loose "scheme + dotted host" test
+_URL_SCHEME_RE = re.compile(r"^https?://", re.IGNORECASE)
+_LOOSE_URL_RE = re.compile(r"^https?://[^\s]+\.[^\s]+", re.IGNORECASE)
+
 
 def extract_company_info(text):
     """Extract company name and domain from message text."""
     # Try to extract URL/domain
-    url_pattern = r'https?://(?:www\.)?([a-zA-Z0-9-]+\.[a-zA-Z0-9.-]+)'
-    domain_pattern = r'\b([a-zA-Z0-9-]+\.(?:com|io|co|ai|org|net|app|vc|xyz|tech|dev))\b'
-
     domain = None
-    url_match = re.search(url_pattern, text)
-    if url_match:
-        domain = url_match.group(1)
-    else:
-        domain_match = re.search(domain_pattern, text)
-        if domain_match:
-            domain = domain_match.group(1)
-
-    # Clean up the company name
-    company_name = text.strip()
-    company_name = re.sub(r'https?://(?:www\.)?', '', company_name)
-    company_name = re.sub(r'\([^)]*\)', '', company_name)
-    # Remove missed/miss/missing keywords
-    company_name = re.sub(r'\b(missed|miss|missing|we|this|one|was|a)\b', '', company_name, flags=re.IGNORECASE)
+    m = _COMPANY_DOMAIN_RE.match(text)
+    if m:
+        domain = m.group("urlhost") or m.group("bare")
+
+    # Clean up the company name. The link is cut out by the span we already
+    # matched, so no extra pass over the text is needed to drop it.
+    company_name = text
+    if m and m.group("url"):
+        company_name = text[:m.start("url")] + text[m.end("url"):]
+    company_name = " ".join(_CLEAN_RE.sub('', company_name).split())
     company_name = company_name.strip(' -–—:/')
 
     # If we have a domain, use it as the search term
@@ -386,10 +694,24 @@ def extract_company_info(text):
     return company_name, domain
 
 
+def analyze_message(text):
+    """Run handle_message's text checks in one place.
+
+    Returns (has_url, is_missed, company_name, domain). Name and domain are
+    only extracted when the message has a link; otherwise both are None.
+    """
+    has_url = bool(_URL_IN_MSG_RE.search(text))
+    is_missed = bool(_MISSED_RE.search(text))
+    if not has_url:
+        return False, is_missed, None, None
+    company_name, domain = extract_company_info(text)
+    return True, is_missed, company_name, domain
+
+
 def strip_urls(text):
     """Remove URLs from text, leaving only plain words — used to build a search seed."""
-    text = re.sub(r'https?://\S+', '', text)
-    text = re.sub(r'\b[a-zA-Z0-9-]+\.(?:com|io|co|ai|org|net|app|vc|xyz|tech|dev)\S*', '', text)
+    text = _ANY_URL_RE.sub('', text)
+    text = _BARE_DOMAIN_TOKEN_RE.sub('', text)
     return text.strip()
 
 
@@ -447,6 +769,9 @@ _SENTENCE_PUNCTUATION_RE = re.compile(r"[?!]")
 # announcements, summaries, or pasted content.
 _MULTILINE_RE = re.compile(r"\n")
 
+_ASCII_LETTER_RE = re.compile(r"[a-zA-Z]")
+_NON_WORD_CHARS_RE = re.compile(r"[^a-zA-Z']")
+
 
 def _looks_like_company_name(text):
     """Return True if the message plausibly is a bare company name worth
@@ -494,13 +819,13 @@ def _looks_like_company_name(text):
         return False
 
     # Strip parenthetical asides like "(seed stage)" before counting words
-    cleaned = re.sub(r"\([^)]*\)", "", stripped).strip()
+    cleaned = _PAREN_RE.sub("", stripped).strip()
     if not cleaned:
         return False
 
     # Must contain at least one ASCII letter — filters out pure emoji,
     # numbers, or punctuation messages
-    if not re.search(r"[a-zA-Z]", cleaned):
+    if not _ASCII_LETTER_RE.search(cleaned):
         return False
 
     tokens = cleaned.split()
@@ -508,7 +833,7 @@ def _looks_like_company_name(text):
         return False
 
     # First-word stoplist check (case-insensitive, strip trailing punctuation)
-    first = re.sub(r"[^a-zA-Z']", "", tokens[0]).lower()
+    first = _NON_WORD_CHARS_RE.sub("", tokens[0]).lower()
     if first in _NON_COMPANY_FIRST_WORDS:
         return False
 
@@ -526,8 +851,8 @@ def _looks_like_company_name(text):
 def clean_seed_text(text):
     """Strip filler words and 'missed' keywords to build a cleaner search seed."""
     text = strip_urls(text)
-    text = re.sub(r'\b(missed|miss|missing|we|this|one|was|a|the)\b', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'[\(\)\[\]<>]', '', text)
+    text = _SEED_NOISE_RE.sub('', text)
+    text = _BRACKETS_RE.sub('', text)
     return " ".join(text.split()).strip()
 
 
@@ -786,6 +1111,12 @@ def _split_query_and_context(seed_text, query_max=120, context_max=1500):
     return query, context
 
 
+# _extract_json_array: code-fence wrappers and the outermost [...] span
+_JSON_FENCE_OPEN_RE = re.compile(r"^```(?:json)?\s*")
+_JSON_FENCE_CLOSE_RE = re.compile(r"\s*```\s*$")
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+
+
 def _extract_json_array(raw):
     """Best-effort JSON array extraction from a model response.
 
@@ -800,8 +1131,8 @@ def _extract_json_array(raw):
 
     # Strip code fences
     if text.startswith("```"):
-        text = re.sub(r"^```(?:json)?\s*", "", text)
-        text = re.sub(r"\s*```\s*$", "", text)
+        text = _JSON_FENCE_OPEN_RE.sub("", text)
+        text = _JSON_FENCE_CLOSE_RE.sub("", text)
         text = text.strip()
 
     # Try direct parse
@@ -821,7 +1152,7 @@ def _extract_json_array(raw):
         pass
 
     # Find first JSON array via greedy regex
-    m = re.search(r"\[.*\]", text, flags=re.DOTALL)
+    m = _JSON_ARRAY_RE.search(text)
     if m:
         try:
             parsed = json.loads(m.group(0))
@@ -890,7 +1221,7 @@ def search_urls_with_brave(seed_text, max_candidates=3):
         # Up to 2 attempts to handle the 1 req/sec rate limit
         last_err = None
         response = None
-        for attempt in range(2):
+        for _ in range(2):
             try:
                 response = requests.get(url, headers=headers, params=params, timeout=10)
                 if response.status_code == 429:
@@ -912,7 +1243,7 @@ def search_urls_with_brave(seed_text, max_candidates=3):
         logger.info(f"Brave raw response ({len(raw)} chars): {raw[:800]}")
 
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
         except Exception as e:
             return {"candidates": [], "error": f"could not parse Brave JSON ({e})", "raw": raw}
 
@@ -927,7 +1258,7 @@ def search_urls_with_brave(seed_text, max_candidates=3):
             result_url = r.get("url") if isinstance(r, dict) else None
             if not result_url or not isinstance(result_url, str):
                 continue
-            m = re.search(r"https?://(?:www\.)?([^/]+)", result_url)
+            m = _URL_HOST_RE.search(result_url)
             domain = m.group(1).lower() if m else result_url.lower()
             if any(ex in domain for ex in EXCLUDED_DOMAINS):
                 continue
@@ -938,10 +1269,10 @@ def search_urls_with_brave(seed_text, max_candidates=3):
             description = r.get("description") or ""
             why = (description or title).strip()
             # strip HTML bold tags Brave sometimes includes
-            why = re.sub(r"<[^>]+>", "", why)[:200]
+            why = _HTML_TAG_RE.sub("", why)[:200]
             cleaned.append({
                 "url": result_url,
-                "name": re.sub(r"<[^>]+>", "", title).strip() or domain.split(".")[0].title(),
+                "name": _HTML_TAG_RE.sub("", title).strip() or domain.split(".")[0].title(),
                 "why": why,
             })
             # Keep up to 10 raw candidates; rank_candidates() narrows to top 3 using the scorer.
@@ -956,6 +1287,13 @@ def search_urls_with_brave(seed_text, max_candidates=3):
         return {"candidates": [], "error": f"Brave call failed: {e}", "raw": raw}
 
 
+# Rough HTML-to-text for candidate homepages (fetch_page_text, domain guesses)
+_SCRIPT_RE = re.compile(r"<script.*?</script>", re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r"<style.*?</style>", re.DOTALL | re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def fetch_page_text(url, timeout=8):
     """Fetch a URL's homepage and return plaintext (rough, no HTML parser)."""
     try:
@@ -964,10 +1302,10 @@ def fetch_page_text(url, timeout=8):
         if not r.ok:
             return ""
         text = r.text
-        text = re.sub(r"<script.*?</script>", " ", text, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r"<style.*?</style>", " ", text, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r"<[^>]+>", " ", text)
-        text = re.sub(r"\s+", " ", text)
+        text = _SCRIPT_RE.sub(" ", text)
+        text = _STYLE_RE.sub(" ", text)
+        text = _HTML_TAG_RE.sub(" ", text)
+        text = _WHITESPACE_RE.sub(" ", text)
         return text[:8000].lower()
     except Exception as e:
         logger.warning(f"Could not fetch {url}: {e}")
@@ -1012,7 +1350,7 @@ def _name_tokens_for_match(query):
         return []
     q = query.lower()
     # Split on non-alphanumeric
-    tokens = re.split(r"[^a-z0-9]+", q)
+    tokens = _NON_ALNUM_RE.split(q)
     out = []
     for t in tokens:
         if len(t) < 3:
@@ -1023,6 +1361,38 @@ def _name_tokens_for_match(query):
     return out
 
 
+# Match any URL path segment that contains a news/article/blog word with word
+# boundaries. Catches "/news/", "/startup-news/", "/press-releases/",
+# "/news-and-events/", "/media-coverage/", etc. without false-matching
+# "/blogger/" or "/products/".
+_NEWS_WORDS = r"(?:news|press|article|articles|story|stories|blog|posts?|media|newsroom|announcements?|insights|coverage|releases?)"
+_ARTICLE_PATH_RE = re.compile(rf"/[^/]*\b{_NEWS_WORDS}\b[^/]*/", re.IGNORECASE)
+_DATE_PATH_RE = re.compile(r"/20[12]\d/\d{1,2}/")  # /2024/03/, /2026/11/
+
+# Funding-news slug fingerprints — URLs like
+# /extellis-raises-6-8m-seed-round-to-launch-.../ have one long path segment
+# that's clearly a news article. These patterns catch those even when the
+# URL doesn't have an explicit /news/ or /press/ prefix.
+_FUNDING_SLUG_RE = re.compile(
+    r"-(?:raises|raised|announces?|launches?|unveils?|debuts?|closes?|emerges?|exits?|acquires?|"
+    r"acquired|secures?|wins?)-"
+    r"|-(?:seed|pre-seed|series-[a-f]\b|series[a-f]\b|round)-"
+    r"|-\d+\s*[-.]?\s*\d*\s*(?:m\b|bn?\b|million|billion)-"
+    r"|-(?:funding|investment|valuation|ipo|exit)-",
+    re.IGNORECASE,
+)
+
+
+def _is_article_url(url):
+    """True if the URL path smells like a news article / press release /
+    funding announcement / date-stamped article."""
+    return bool(
+        _ARTICLE_PATH_RE.search(url)
+        or _DATE_PATH_RE.search(url)
+        or _FUNDING_SLUG_RE.search(url)
+    )
+
+
 def rank_candidates(candidates, query=""):
     """Score each candidate and sort by descending match.
 
@@ -1043,39 +1413,15 @@ def rank_candidates(candidates, query=""):
     """
     name_tokens = _name_tokens_for_match(query)
 
-    # Match any URL path segment that contains a news/article/blog word with word
-    # boundaries. Catches "/news/", "/startup-news/", "/press-releases/",
-    # "/news-and-events/", "/media-coverage/", etc. without false-matching
-    # "/blogger/" or "/products/".
-    _news_words = r"(?:news|press|article|articles|story|stories|blog|posts?|media|newsroom|announcements?|insights|coverage|releases?)"
-    article_path_re = re.compile(
-        rf"/[^/]*\b{_news_words}\b[^/]*/",
-        re.IGNORECASE,
-    )
-    date_path_re = re.compile(r"/20[12]\d/\d{1,2}/")  # /2024/03/, /2026/11/
-
-    # Funding-news slug fingerprints — URLs like
-    # /extellis-raises-6-8m-seed-round-to-launch-.../ have one long path segment
-    # that's clearly a news article. These patterns catch those even when the
-    # URL doesn't have an explicit /news/ or /press/ prefix.
-    funding_slug_re = re.compile(
-        r"-(?:raises|raised|announces?|launches?|unveils?|debuts?|closes?|emerges?|exits?|acquires?|"
-        r"acquired|secures?|wins?)-"
-        r"|-(?:seed|pre-seed|series-[a-f]\b|series[a-f]\b|round)-"
-        r"|-\d+\s*[-.]?\s*\d*\s*(?:m\b|bn?\b|million|billion)-"
-        r"|-(?:funding|investment|valuation|ipo|exit)-",
-        re.IGNORECASE,
-    )
-
     scored = []
     sector_hits_by_idx = {}
     retail_by_idx = {}
     for idx, c in enumerate(candidates):
         url = c["url"]
-        m = re.search(r"https?://(?:www\.)?([^/]+)", url)
+        m = _URL_HOST_RE.search(url)
         hostname = (m.group(1) if m else url).lower()
         # Drop TLD suffixes for matching (e.g. extellis.com → extellis)
-        hostname_core = re.split(r"[^a-z0-9]+", hostname)
+        hostname_core = _NON_ALNUM_RE.split(hostname)
 
         # Name-match boost: +1000 if any meaningful name token appears in the hostname
         name_boost = 0
@@ -1086,7 +1432,7 @@ def rank_candidates(candidates, query=""):
 
         # URL-path penalty for news/blog/article paths and funding-news slugs
         path_penalty = 0
-        if article_path_re.search(url) or date_path_re.search(url) or funding_slug_re.search(url):
+        if _is_article_url(url):
             path_penalty = 500
 
         # Score content: sector keyword hits vs. retail + VC-firm signals
@@ -1201,21 +1547,21 @@ def guess_company_domains(query, timeout=5):
                 continue
             # Check that the final URL isn't a parked-domain/registrar page
             final_host = ""
-            mm = re.search(r"https?://(?:www\.)?([^/]+)", r.url or "")
+            mm = _URL_HOST_RE.search(r.url or "")
             if mm:
                 final_host = mm.group(1).lower()
             if any(ex in final_host for ex in EXCLUDED_DOMAINS):
                 continue
             # Strip HTML, check the name appears in the page body
             body = r.text or ""
-            body = re.sub(r"<script.*?</script>", " ", body, flags=re.DOTALL | re.IGNORECASE)
-            body = re.sub(r"<style.*?</style>", " ", body, flags=re.DOTALL | re.IGNORECASE)
-            body = re.sub(r"<[^>]+>", " ", body)
+            body = _SCRIPT_RE.sub(" ", body)
+            body = _STYLE_RE.sub(" ", body)
+            body = _HTML_TAG_RE.sub(" ", body)
             body_lower = body.lower()
             if name_lower not in body_lower:
                 continue
             # Grab a rough description: first ~180 chars of visible text
-            cleaned_body = re.sub(r"\s+", " ", body).strip()
+            cleaned_body = _WHITESPACE_RE.sub(" ", body).strip()
             why = cleaned_body[:180]
             found.append({
                 "url": r.url or url,
@@ -1280,7 +1626,7 @@ def build_poll_blocks(seed_text, candidates, poster_id, is_missed, linkedin_url=
         })[:1900]  # Slack value limit is 2000
 
         why = (c.get("why") or "").strip()
-        why = re.sub(r"\s+", " ", why)[:180]
+        why = _WHITESPACE_RE.sub(" ", why)[:180]
         url_display = c["url"]
         if why:
             row_text = f"*{idx+1}.* <{url_display}|{url_display}>\n_{why}_"
@@ -1337,49 +1683,118 @@ def build_poll_blocks(seed_text, candidates, poster_id, is_missed, linkedin_url=
     return blocks
 
 
+# Lowercased poll seeds whose search recently produced nothing usable, mapped
+# to why ("no_candidates" / "off_thesis"). Chatter that slips past
+# _looks_like_company_name tends to be reposted; without this each repeat
+# costs a Brave query plus up to ~30 homepage and domain-guess fetches.
+_no_match_seeds = _TTLCache(ttl=600, maxsize=2048)
+
+
 def post_url_poll(client, channel, thread_ts, poster_id, seed_text, is_missed, linkedin_url=None):
     """Search for candidates and post the poll in-channel (not threaded)."""
     logger.info(f"Running URL search poll for seed='{seed_text[:120]}' (linkedin={linkedin_url})")
 
-    result = search_urls_with_brave(seed_text, max_candidates=3)
-    candidates = result["candidates"]
-    err = result["error"]
-
     # Build a display name: the focused query (first line / truncated)
     display_query, _ = _split_query_and_context(seed_text)
     display_name = display_query or seed_text[:80]
     query_for_rank = display_query or seed_text
     name_tokens = _name_tokens_for_match(query_for_rank)
 
+    def _post_no_match_fallback(text_msg):
+        """Post a no-match fallback with Write-in-URL + Stealth buttons so the
+        poster can resolve with one click — especially useful when a LinkedIn
+        URL is present and we want to stash it as a Stealth note."""
+        reply_value = json.dumps({
+            "poster_id": poster_id,
+            "is_missed": is_missed,
+            "seed": display_name,
+            "linkedin_url": linkedin_url,
+        })[:1900]
+        stealth_value = json.dumps({
+            "poster_id": poster_id,
+            "is_missed": is_missed,
+            "seed": display_name,
+            "linkedin_url": linkedin_url,
+        })[:1900]
+
+        stealth_label = (
+            "🕶 Stealth (save LinkedIn as note)"
+            if linkedin_url else
+            "🕶 Stealth / no website"
+        )
+
+        blocks = [
+            {"type": "section", "text": {"type": "mrkdwn", "text": text_msg}},
+            {
+                "type": "actions",
+                "elements": [
+                    {
+                        "type": "button",
+                        "text": {"type": "plain_text", "text": "✍️ Write in URL", "emoji": True},
+                        "action_id": "url_reply_later",
+                        "value": reply_value,
+                    },
+                    {
+                        "type": "button",
+                        "text": {"type": "plain_text", "text": stealth_label, "emoji": True},
+                        "action_id": "url_stealth",
+                        "value": stealth_value,
+                        "style": "primary",
+                    },
+                ],
+            },
+        ]
+        client.chat_postMessage(
+            channel=channel,
+            text=text_msg,
+            blocks=blocks,
+            unfurl_links=False,
+            unfurl_media=False,
+        )
+
+    def _no_match_text(reason, err=None):
+        if reason == "off_thesis":
+            text_msg = (
+                f"<@{poster_id}> I couldn't find any websites matching Overture's sectors "
+                f"for *{display_name}*. Try adding a short description (e.g. what they do), "
+                f"or use the buttons below."
+            )
+        elif err:
+            # Surface the actual error so we can debug in Slack, not just Railway logs
+            text_msg = (
+                f"<@{poster_id}> ⚠️ URL search failed for *{display_name}* — `{err}`."
+            )
+        else:
+            text_msg = (
+                f"<@{poster_id}> I couldn't find any likely websites for *{display_name}*."
+            )
+        if linkedin_url:
+            text_msg += f"\n🔗 LinkedIn: <{linkedin_url}|{linkedin_url}>"
+        return text_msg
+
+    # Seeds that recently came up empty skip Brave, the domain-guess probes and
+    # the homepage fetches entirely — reposting the same name won't change the
+    # answer within the negative-cache window.
+    seed_key = seed_text.strip().lower()
+    cached_reason = _no_match_seeds.get(seed_key)
+    if cached_reason:
+        logger.info(f"Seed '{seed_key[:80]}' had no usable candidates recently — skipping search")
+        _post_no_match_fallback(_no_match_text(cached_reason))
+        return
+
+    result = search_urls_with_brave(seed_text, max_candidates=3)
+    candidates = result["candidates"]
+    err = result["error"]
+
     def _hostname_contains_name(url):
-        m = re.search(r"https?://(?:www\.)?([^/]+)", url)
+        m = _URL_HOST_RE.search(url)
         host = (m.group(1) if m else "").lower()
-        host_segs = re.split(r"[^a-z0-9]+", host)
+        host_segs = _NON_ALNUM_RE.split(host)
         return any(any(t == seg or t in seg for seg in host_segs) for t in name_tokens)
 
-    def _has_penalty_path(url):
-        """True if the URL path smells like a news article / press release /
-        funding announcement / date-stamped article."""
-        # Import the patterns built in rank_candidates. Rebuild here to avoid
-        # exporting them at module level just for this callsite.
-        _news_words = r"(?:news|press|article|articles|story|stories|blog|posts?|media|newsroom|announcements?|insights|coverage|releases?)"
-        if re.search(rf"/[^/]*\b{_news_words}\b[^/]*/", url, re.IGNORECASE):
-            return True
-        if re.search(r"/20[12]\d/\d{1,2}/", url):
-            return True
-        if re.search(
-            r"-(?:raises|raised|announces?|launches?|unveils?|debuts?|closes?|secures?|acquires?|acquired|wins?)-"
-            r"|-(?:seed|pre-seed|series-[a-f]\b|series[a-f]\b|round)-"
-            r"|-\d+\s*[-.]?\s*\d*\s*(?:m\b|bn?\b|million|billion)-"
-            r"|-(?:funding|investment|valuation|ipo|exit)-",
-            url, re.IGNORECASE
-        ):
-            return True
-        return False
-
     hostname_matches = [c for c in candidates if _hostname_contains_name(c["url"])]
     hostname_matches_without_penalty = [
-        c for c in hostname_matches if not _has_penalty_path(c["url"])
+        c for c in hostname_matches if not _is_article_url(c["url"])
     ]
 
     # Auto-promote: for any hostname-matching candidate that has a penalty path
@@ -1389,16 +1804,16 @@ def post_url_poll(client, channel, thread_ts, poster_id, seed_text, is_missed, l
     # homepage wins naturally because it has no path penalty.
     existing_urls = {c["url"] for c in candidates}
     for c in list(hostname_matches):
-        if not _has_penalty_path(c["url"]):
+        if not _is_article_url(c["url"]):
             continue
-        m = re.search(r"(https?://[^/]+)", c["url"])
+        m = _URL_ROOT_RE.search(c["url"])
         if not m:
             continue
         root = m.group(1) + "/"
         if root in existing_urls:
             continue
         # Extract the hostname for display
-        mh = re.search(r"https?://(?:www\.)?([^/]+)", root)
+        mh = _URL_HOST_RE.search(root)
         root_hostname = mh.group(1) if mh else root
         candidates.append({
             "url": root,
@@ -1411,7 +1826,7 @@ def post_url_poll(client, channel, thread_ts, poster_id, seed_text, is_missed, l
     # Refresh the hostname-match sets now that we've added roots
     hostname_matches = [c for c in candidates if _hostname_contains_name(c["url"])]
     hostname_matches_without_penalty = [
-        c for c in hostname_matches if not _has_penalty_path(c["url"])
+        c for c in hostname_matches if not _is_article_url(c["url"])
     ]
 
     # Domain-guess fallback still fires when Brave returned nothing usable OR
@@ -1431,79 +1846,19 @@ def post_url_poll(client, channel, thread_ts, poster_id, seed_text, is_missed, l
             # Dedupe by domain against existing candidates
             existing_domains = set()
             for c in candidates:
-                m = re.search(r"https?://(?:www\.)?([^/]+)", c["url"])
+                m = _URL_HOST_RE.search(c["url"])
                 if m:
                     existing_domains.add(m.group(1).lower())
             for g in guessed:
-                m = re.search(r"https?://(?:www\.)?([^/]+)", g["url"])
+                m = _URL_HOST_RE.search(g["url"])
                 if m and m.group(1).lower() not in existing_domains:
                     candidates.append(g)
 
-    def _post_no_match_fallback(text_msg):
-        """Post a no-match fallback with Write-in-URL + Stealth buttons so the
-        poster can resolve with one click — especially useful when a LinkedIn
-        URL is present and we want to stash it as a Stealth note."""
-        reply_value = json.dumps({
-            "poster_id": poster_id,
-            "is_missed": is_missed,
-            "seed": display_name,
-            "linkedin_url": linkedin_url,
-        })[:1900]
-        stealth_value = json.dumps({
-            "poster_id": poster_id,
-            "is_missed": is_missed,
-            "seed": display_name,
-            "linkedin_url": linkedin_url,
-        })[:1900]
-
-        stealth_label = (
-            "🕶 Stealth (save LinkedIn as note)"
-            if linkedin_url else
-            "🕶 Stealth / no website"
-        )
-
-        blocks = [
-            {"type": "section", "text": {"type": "mrkdwn", "text": text_msg}},
-            {
-                "type": "actions",
-                "elements": [
-                    {
-                        "type": "button",
-                        "text": {"type": "plain_text", "text": "✍️ Write in URL", "emoji": True},
-                        "action_id": "url_reply_later",
-                        "value": reply_value,
-                    },
-                    {
-                        "type": "button",
-                        "text": {"type": "plain_text", "text": stealth_label, "emoji": True},
-                        "action_id": "url_stealth",
-                        "value": stealth_value,
-                        "style": "primary",
-                    },
-                ],
-            },
-        ]
-        client.chat_postMessage(
-            channel=channel,
-            text=text_msg,
-            blocks=blocks,
-            unfurl_links=False,
-            unfurl_media=False,
-        )
-
     if not candidates:
-        if err:
-            # Surface the actual error so we can debug in Slack, not just Railway logs
-            fallback = (
-                f"<@{poster_id}> ⚠️ URL search failed for *{display_name}* — `{err}`."
-            )
-        else:
-            fallback = (
-                f"<@{poster_id}> I couldn't find any likely websites for *{display_name}*."
-            )
-        if linkedin_url:
-            fallback += f"\n🔗 LinkedIn: <{linkedin_url}|{linkedin_url}>"
-        _post_no_match_fallback(fallback)
+        # Only cache clean misses — a failed Brave call may succeed next time.
+        if not err:
+            _no_match_seeds.set(seed_key, "no_candidates")
+        _post_no_match_fallback(_no_match_text("no_candidates", err))
         return
 
     # Cap to top 3 after ranking. Pass the query so the ranker can boost
@@ -1514,14 +1869,8 @@ def post_url_poll(client, channel, thread_ts, poster_id, seed_text, is_missed, l
 
     # If the hard sector filter emptied the pool, bail out with buttons to resolve.
     if not candidates:
-        fallback = (
-            f"<@{poster_id}> I couldn't find any websites matching Overture's sectors "
-            f"for *{display_name}*. Try adding a short description (e.g. what they do), "
-            f"or use the buttons below."
-        )
-        if linkedin_url:
-            fallback += f"\n🔗 LinkedIn: <{linkedin_url}|{linkedin_url}>"
-        _post_no_match_fallback(fallback)
+        _no_match_seeds.set(seed_key, "off_thesis")
+        _post_no_match_fallback(_no_match_text("off_thesis"))
         return
 
     blocks = build_poll_blocks(
@@ -1555,22 +1904,125 @@ def disable_poll_message(client, channel, ts, resolved_text):
         logger.warning(f"Could not update poll message: {e}")
 
 
+# list_id -> (stage_field_id, {dropdown option id: text})
+_stage_schema_cache = _TTLCache(ttl=AFFINITY_SCHEMA_TTL, maxsize=16)
+# list_id -> wall-clock time the cached schema was fetched from Affinity. An
+# unknown option only forces a refetch when the schema is older than the
+# grace period, so one org holding a deleted option can't flush it per lookup.
+_stage_schema_fetched_at = {}
+STAGE_SCHEMA_REFRESH_GRACE = 60  # seconds
+
+
+def _read_stage_schema_file():
+    """Return the persisted {list_id: schema} map, or {} if absent/unreadable."""
+    try:
+        with open(AFFINITY_SCHEMA_CACHE_PATH, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable stage schema cache: {e}")
+        return {}
+
+
+def _write_stage_schema_file(data):
+    """Atomically replace the persisted schema map. Failures are only logged —
+    the disk copy is an optimization, never a requirement."""
+    try:
+        os.makedirs(os.path.dirname(AFFINITY_SCHEMA_CACHE_PATH), exist_ok=True)
+        tmp_path = f"{AFFINITY_SCHEMA_CACHE_PATH}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(data))
+        os.replace(tmp_path, AFFINITY_SCHEMA_CACHE_PATH)
+    except Exception as e:
+        logger.warning(f"Could not persist stage schema cache: {e}")
+
+
+def _invalidate_stage_schema(list_id):
+    """Forget a list's stage schema in memory and on disk."""
+    _stage_schema_cache.pop(list_id)
+    _nudge_schema_cache.pop(list_id)
+    affinity.invalidate_list_fields(list_id)
+    data = _read_stage_schema_file()
+    if data.pop(str(list_id), None) is not None:
+        _write_stage_schema_file(data)
+
+
+def _resolve_stage_schema(list_id):
+    """Return (stage_field_id, stage_options) for a list, cached for
+    AFFINITY_SCHEMA_TTL seconds in memory and on disk."""
+    cached = _stage_schema_cache.get(list_id)
+    # The memory entry's own TTL restarts when a disk copy is loaded, so
+    # age it from when the schema was actually fetched.
+    if cached is not None and time.time() - _stage_schema_fetched_at.get(list_id, 0) < AFFINITY_SCHEMA_TTL:
+        return cached
+
+    stored = _read_stage_schema_file().get(str(list_id))
+    if stored and time.time() - stored.get("saved_at", 0) < AFFINITY_SCHEMA_TTL:
+        # JSON object keys are strings; option IDs are ints in Affinity
+        schema = (stored["field_id"], {int(k): v for k, v in stored["options"].items()})
+        _stage_schema_cache.set(list_id, schema)
+        _stage_schema_fetched_at[list_id] = stored["saved_at"]
+        return schema
+
+    # Get list fields to find the stage/status field
+    fields = affinity.get_list_fields(list_id)
+    stage_field_id = None
+    stage_options = {}
+
+    for field in fields:
+        field_name = field.get("name", "").lower()
+        if field_name in STAGE_FIELD_NAMES:
+            stage_field_id = field.get("id")
+            # Build mapping of dropdown option IDs to names
+            for option in field.get("dropdown_options", []):
+                stage_options[option["id"]] = option["text"]
+            break
+
+    schema = (stage_field_id, stage_options)
+    _stage_schema_cache.set(list_id, schema)
+    _stage_schema_fetched_at[list_id] = time.time()
+    if stage_field_id:
+        data = _read_stage_schema_file()
+        data[str(list_id)] = {
+            "saved_at": time.time(),
+            "field_id": stage_field_id,
+            "options": {str(k): v for k, v in stage_options.items()},
+        }
+        _write_stage_schema_file(data)
+    return schema
+
+
+# (list_id, organization_id) -> stage name. Absorbs repeat lookups of the same
+# org in a short window; a stage change in Affinity shows up within a minute.
+_stage_cache = _TTLCache(ttl=60, maxsize=1024)
+
+
+def _stage_from_field_values(field_values, stage_field_id, stage_options):
+    """Pick the stage out of a field-values list.
+
+    Raises KeyError(option_id) for a dropdown option ID that isn't in
+    stage_options, which means the cached schema is out of date.
+    """
+    for fv in field_values:
+        if fv.get("field_id") == stage_field_id:
+            value = fv.get("value")
+            if isinstance(value, dict) and "text" in value:
+                return value["text"]
+            elif isinstance(value, int) and stage_options:
+                return stage_options[value]
+            return str(value) if value else "Not set"
+    return "Not set"
+
+
 def get_stage_name(organization_id, list_id):
     """Get the current stage name for an organization in a list."""
+    cached = _stage_cache.get((list_id, organization_id))
+    if cached is not None:
+        return cached
+
     try:
-        # Get list fields to find the stage/status field
-        fields = affinity.get_list_fields(list_id)
-        stage_field_id = None
-        stage_options = {}
-
-        for field in fields:
-            field_name = field.get("name", "").lower()
-            if field_name in ["stage", "status", "deal stage"]:
-                stage_field_id = field.get("id")
-                # Build mapping of dropdown option IDs to names
-                for option in field.get("dropdown_options", []):
-                    stage_options[option["id"]] = option["text"]
-                break
+        stage_field_id, stage_options = _resolve_stage_schema(list_id)
 
         if not stage_field_id:
             return "Unknown"
@@ -1578,16 +2030,25 @@ def get_stage_name(organization_id, list_id):
         # Get field values for this organization
         field_values = affinity.get_field_values(organization_id)
 
-        for fv in field_values:
-            if fv.get("field_id") == stage_field_id:
-                value = fv.get("value")
-                if isinstance(value, dict) and "text" in value:
-                    return value["text"]
-                elif isinstance(value, int) and value in stage_options:
-                    return stage_options[value]
-                return str(value) if value else "Not set"
+        try:
+            stage = _stage_from_field_values(field_values, stage_field_id, stage_options)
+        except KeyError as e:
+            # An option we don't know about — the list's dropdown may have
+            # changed. Refetch the schema unless it is itself brand new; if the
+            # option is still unknown (e.g. deleted from the dropdown), fall
+            # back to the raw ID and cache that like any other answer.
+            stage = str(e.args[0])
+            if time.time() - _stage_schema_fetched_at.get(list_id, 0) >= STAGE_SCHEMA_REFRESH_GRACE:
+                logger.info(f"Unknown stage option {e.args[0]} — refreshing cached schema for list {list_id}")
+                _invalidate_stage_schema(list_id)
+                stage_field_id, stage_options = _resolve_stage_schema(list_id)
+                try:
+                    stage = _stage_from_field_values(field_values, stage_field_id, stage_options)
+                except KeyError:
+                    pass
 
-        return "Not set"
+        _stage_cache.set((list_id, organization_id), stage)
+        return stage
     except Exception as e:
         logger.error(f"Error getting stage: {e}")
         return "Unknown"
@@ -1598,8 +2059,9 @@ def check_org_in_list(organization_id, list_id):
     try:
         org = affinity.get_organization(organization_id)
         list_entries = org.get("list_entries", [])
+        target_list_id = int(list_id)
         for entry in list_entries:
-            if entry.get("list_id") == int(list_id):
+            if entry.get("list_id") == target_list_id:
                 return True, entry
         return False, None
     except Exception as e:
@@ -1607,46 +2069,157 @@ def check_org_in_list(organization_id, list_id):
         return False, None
 
 
-def get_list_entry_details(org_id, list_id):
-    """Get owner names and pass reason for an org in a list."""
+def get_list_entry_details(list_entry):
+    """Get owner names and pass reason for a list entry.
+
+    Takes the entry check_org_in_list already found, so the org isn't
+    fetched a second time.
+    """
     try:
-        org = affinity.get_organization(org_id)
-        list_entries = org.get("list_entries", [])
+        field_values = affinity.get_list_entry_field_values(list_entry.get("id"))
 
-        for entry in list_entries:
-            if entry.get("list_id") == int(list_id):
-                list_entry_id = entry.get("id")
-                field_values = affinity.get_list_entry_field_values(list_entry_id)
-
-                owners = []
-                pass_reasons = []
-
-                for fv in field_values:
-                    # Get owners
-                    if fv.get("field_id") == OWNERS_FIELD_ID:
-                        person_id = fv.get("value")
-                        if person_id:
-                            owner_name = get_owner_name_from_id(person_id)
-                            if owner_name:
-                                owners.append(owner_name)
-
-                    # Get pass reason
-                    if fv.get("field_id") == PASS_REASON_FIELD_ID:
-                        value = fv.get("value")
-                        if isinstance(value, dict) and "text" in value:
-                            pass_reasons.append(value["text"])
-                        elif value:
-                            pass_reasons.append(str(value))
-
-                return owners, pass_reasons
+        owners = []
+        pass_reasons = []
 
-        return [], []
+        for fv in field_values:
+            # Get owners
+            if fv.get("field_id") == OWNERS_FIELD_ID:
+                person_id = fv.get("value")
+                if person_id:
+                    owner_name = get_owner_name_from_id(person_id)
+                    if owner_name:
+                        owners.append(owner_name)
+
+            # Get pass reason
+            if fv.get("field_id") == PASS_REASON_FIELD_ID:
+                value = fv.get("value")
+                if isinstance(value, dict) and "text" in value:
+                    pass_reasons.append(value["text"])
+                elif value:
+                    pass_reasons.append(str(value))
+
+        return owners, pass_reasons
     except Exception as e:
         logger.error(f"Error getting list entry details: {e}")
         return [], []
 
 
+# Short-lived memo of "already in pipeline" answers, keyed by the normalized
+# (name, domain). Retries, copy-pastes and several people posting the same
+# company within a minute reuse the answer instead of re-running the whole
+# Affinity lookup chain. Only "exists" results are stored: created/added
+# results describe a write, and errors should be retried.
+_company_result_cache = _TTLCache(ttl=60, maxsize=512)
+
+
+def _company_cache_key(search_term, domain):
+    return ((search_term or "").strip().lower(), domain.lower() if domain else None)
+
+
+# Lookups currently running, keyed by the term _process_company actually
+# searches and creates on (the domain when there is one), so "Acme
+# https://acme.com" and "https://acme.com" share a slot. Only one chain per
+# term runs at a time — two racing chains could both call
+# create_organization and leave duplicate orgs in Affinity.
+_inflight_companies = {}
+_inflight_lock = threading.Lock()
+
+
+def _inflight_key(search_term, domain):
+    return (domain or search_term or "").strip().lower()
+
+
 def process_company(search_term, domain=None, is_missed=False, slack_user_id=None, note=None, stealth=False):
+    """Memoized, single-flight front for _process_company — see there for behavior.
+
+    A call for a company that is already mid-lookup waits for that lookup to
+    finish and then runs its own, with its own flags. By then the org is in
+    the pipeline, so it reports "exists" rather than creating it again.
+    """
+    key = _company_cache_key(search_term, domain)
+    flight_key = _inflight_key(search_term, domain)
+
+    while True:
+        cached = _company_result_cache.get(key)
+        if cached is not None:
+            logger.info(f"Using cached pipeline lookup for {key}")
+            return cached
+
+        with _inflight_lock:
+            pending = _inflight_companies.get(flight_key)
+            if pending is None:
+                pending = _inflight_companies[flight_key] = Future()
+                break
+
+        logger.info(f"Waiting on in-flight pipeline lookup for {flight_key!r}")
+        # Blocks until the other lookup is done; its outcome isn't ours.
+        pending.exception()
+
+    try:
+        result = _process_company(
+            search_term, domain,
+            is_missed=is_missed,
+            slack_user_id=slack_user_id,
+            note=note,
+            stealth=stealth,
+        )
+        if result.get("status") == "exists":
+            _company_result_cache.set(key, result)
+    except BaseException as e:
+        with _inflight_lock:
+            _inflight_companies.pop(flight_key, None)
+        pending.set_exception(e)
+        raise
+
+    with _inflight_lock:
+        _inflight_companies.pop(flight_key, None)
+    pending.set_result(result)
+    return result
+
+
+def _populate_new_list_entry(org_id, list_entry_id, is_missed=False, slack_user_id=None, note=None, stealth=False):
+    """Write owner, status and note onto a freshly added pipeline entry.
+
+    The writes don't depend on each other, so they go out together on the
+    Affinity pool rather than one after another. Failures are logged and
+    don't stop the other writes. Returns True if the Missed status was set.
+    """
+    writes = {}
+
+    # Set owner if we have a slack user mapping
+    if slack_user_id and slack_user_id in SLACK_TO_AFFINITY_PERSON:
+        affinity_person_id = SLACK_TO_AFFINITY_PERSON[slack_user_id]
+        writes["setting owner"] = _affinity_pool.submit(
+            affinity.set_field_value, OWNERS_FIELD_ID, org_id, list_entry_id, affinity_person_id
+        )
+
+    # Missed takes precedence; stealth only tags the status when configured
+    if is_missed:
+        writes["setting missed status"] = _affinity_pool.submit(
+            affinity.set_field_value, STATUS_FIELD_ID, org_id, list_entry_id, MISSED_STATUS_VALUE_ID
+        )
+    elif stealth and STEALTH_STATUS_VALUE_ID is not None:
+        writes["setting stealth status"] = _affinity_pool.submit(
+            affinity.set_field_value, STATUS_FIELD_ID, org_id, list_entry_id, STEALTH_STATUS_VALUE_ID
+        )
+
+    if note:
+        writes["creating note"] = _affinity_pool.submit(affinity.create_note, org_id, note)
+
+    succeeded = set()
+    for what, future in writes.items():
+        try:
+            future.result()
+            succeeded.add(what)
+        except Exception as e:
+            logger.error(f"Error {what}: {e}")
+    if "setting owner" in succeeded:
+        logger.info(f"Set owner to person {SLACK_TO_AFFINITY_PERSON[slack_user_id]}")
+
+    return "setting missed status" in succeeded
+
+
+def _process_company(search_term, domain=None, is_missed=False, slack_user_id=None, note=None, stealth=False):
     """Check if company exists in deal pipeline. If yes, return current stage. If no, add it.
 
     When stealth=True and STEALTH_STATUS_VALUE_ID is configured, the new list
@@ -1664,14 +2237,15 @@ def process_company(search_term, domain=None, is_missed=False, slack_user_id=Non
 
         organization = None
         if orgs:
-            # Find best match
+            # Find best match. Lowercase the needles once, not per org.
+            name_needle = search_term.lower()
+            domain_needle = domain.lower() if domain else None
             for org in orgs:
-                org_domain = org.get("domain", "")
-                org_name = org.get("name", "").lower()
-                if domain and org_domain and domain.lower() in org_domain.lower():
+                org_domain = org.get("domain") or ""
+                if domain_needle and org_domain and domain_needle in org_domain.lower():
                     organization = org
                     break
-                if search_term.lower() in org_name:
+                if name_needle in (org.get("name") or "").lower():
                     organization = org
                     break
             if not organization:
@@ -1686,9 +2260,11 @@ def process_company(search_term, domain=None, is_missed=False, slack_user_id=Non
             in_list, entry = check_org_in_list(org_id, AFFINITY_LIST_ID)
 
             if in_list:
-                # Already in pipeline - get current stage, owner, and pass reason
+                # Already in pipeline - get current stage, owner, and pass reason.
+                # The two lookups are independent, so fetch them concurrently.
+                details_future = _affinity_pool.submit(get_list_entry_details, entry)
                 stage = get_stage_name(org_id, AFFINITY_LIST_ID)
-                owners, pass_reasons = get_list_entry_details(org_id, AFFINITY_LIST_ID)
+                owners, pass_reasons = details_future.result()
 
                 message = f"*{org_name}* is already in the deal pipeline.\n📊 Current stage: *{stage}*"
 
@@ -1708,44 +2284,19 @@ def process_company(search_term, domain=None, is_missed=False, slack_user_id=Non
                 # Org exists but not in pipeline - add it
                 list_entry = affinity.add_to_list(AFFINITY_LIST_ID, org_id)
 
-                # Set owner if we have a slack user mapping
-                if slack_user_id and slack_user_id in SLACK_TO_AFFINITY_PERSON:
-                    try:
-                        affinity_person_id = SLACK_TO_AFFINITY_PERSON[slack_user_id]
-                        affinity.set_field_value(OWNERS_FIELD_ID, org_id, list_entry["id"], affinity_person_id)
-                        logger.info(f"Set owner to person {affinity_person_id}")
-                    except Exception as e:
-                        logger.error(f"Error setting owner: {e}")
-
-                # If marked as missed, set the status
-                if is_missed:
-                    try:
-                        affinity.set_field_value(STATUS_FIELD_ID, org_id, list_entry["id"], MISSED_STATUS_VALUE_ID)
-                        if note:
-                            try:
-                                affinity.create_note(org_id, note)
-                            except Exception as e:
-                                logger.error(f"Error creating note: {e}")
-                        return {
-                            "status": "added",
-                            "company": org_name,
-                            "message": f"😢 Added *{org_name}* to the deal pipeline as *Missed*."
-                        }
-                    except Exception as e:
-                        logger.error(f"Error setting missed status: {e}")
-
-                # If marked as stealth, set the status (if configured)
-                if stealth and STEALTH_STATUS_VALUE_ID is not None:
-                    try:
-                        affinity.set_field_value(STATUS_FIELD_ID, org_id, list_entry["id"], STEALTH_STATUS_VALUE_ID)
-                    except Exception as e:
-                        logger.error(f"Error setting stealth status: {e}")
-
-                if note:
-                    try:
-                        affinity.create_note(org_id, note)
-                    except Exception as e:
-                        logger.error(f"Error creating note: {e}")
+                missed_set = _populate_new_list_entry(
+                    org_id, list_entry["id"],
+                    is_missed=is_missed,
+                    slack_user_id=slack_user_id,
+                    note=note,
+                    stealth=stealth,
+                )
+                if missed_set:
+                    return {
+                        "status": "added",
+                        "company": org_name,
+                        "message": f"😢 Added *{org_name}* to the deal pipeline as *Missed*."
+                    }
 
                 msg_suffix = " as *Stealth*" if stealth else " as a new lead"
                 return {
@@ -1763,44 +2314,19 @@ def process_company(search_term, domain=None, is_missed=False, slack_user_id=Non
 
             list_entry = affinity.add_to_list(AFFINITY_LIST_ID, org_id)
 
-            # Set owner if we have a slack user mapping
-            if slack_user_id and slack_user_id in SLACK_TO_AFFINITY_PERSON:
-                try:
-                    affinity_person_id = SLACK_TO_AFFINITY_PERSON[slack_user_id]
-                    affinity.set_field_value(OWNERS_FIELD_ID, org_id, list_entry["id"], affinity_person_id)
-                    logger.info(f"Set owner to person {affinity_person_id}")
-                except Exception as e:
-                    logger.error(f"Error setting owner: {e}")
-
-            # If marked as missed, set the status
-            if is_missed:
-                try:
-                    affinity.set_field_value(STATUS_FIELD_ID, org_id, list_entry["id"], MISSED_STATUS_VALUE_ID)
-                    if note:
-                        try:
-                            affinity.create_note(org_id, note)
-                        except Exception as e:
-                            logger.error(f"Error creating note: {e}")
-                    return {
-                        "status": "created",
-                        "company": org_name,
-                        "message": f"😢 Created *{org_name}* and added to the deal pipeline as *Missed*."
-                    }
-                except Exception as e:
-                    logger.error(f"Error setting missed status: {e}")
-
-            # If marked as stealth, set the status (if configured)
-            if stealth and STEALTH_STATUS_VALUE_ID is not None:
-                try:
-                    affinity.set_field_value(STATUS_FIELD_ID, org_id, list_entry["id"], STEALTH_STATUS_VALUE_ID)
-                except Exception as e:
-                    logger.error(f"Error setting stealth status: {e}")
-
-            if note:
-                try:
-                    affinity.create_note(org_id, note)
-                except Exception as e:
-                    logger.error(f"Error creating note: {e}")
+            missed_set = _populate_new_list_entry(
+                org_id, list_entry["id"],
+                is_missed=is_missed,
+                slack_user_id=slack_user_id,
+                note=note,
+                stealth=stealth,
+            )
+            if missed_set:
+                return {
+                    "status": "created",
+                    "company": org_name,
+                    "message": f"😢 Created *{org_name}* and added to the deal pipeline as *Missed*."
+                }
 
             msg_suffix = " as *Stealth*" if stealth else " as a new lead"
             return {
@@ -1824,162 +2350,298 @@ def process_company(search_term, domain=None, is_missed=False, slack_user_id=Non
         }
 
 
-def get_deals_needing_nudge():
-    """Get all deals that have been in a stage longer than the threshold."""
+_nudge_schema_cache = _TTLCache(ttl=AFFINITY_SCHEMA_TTL, maxsize=16)
+
+
+def _resolve_nudge_schema(list_id):
+    """Return (status_field_id, status_options, owners_field_id) for a list,
+    cached for AFFINITY_SCHEMA_TTL seconds."""
+    cached = _nudge_schema_cache.get(list_id)
+    if cached is not None:
+        return cached
+
+    status_field_id = None
+    owners_field_id = None
+    status_options = {}
+    for field in affinity.get_list_fields(list_id):
+        field_name = field.get("name", "").lower()
+        if field_name in ["status", "stage"]:
+            status_field_id = field.get("id")
+            for option in field.get("dropdown_options", []):
+                status_options[option["id"]] = option["text"]
+        elif field_name == "owners":
+            owners_field_id = field.get("id")
+
+    schema = (status_field_id, status_options, owners_field_id)
+    if status_field_id:
+        _nudge_schema_cache.set(list_id, schema)
+    return schema
+
+
+_UTC = timezone.utc
+
+
+def _parse_iso(ts):
+    """Parse an Affinity ISO-8601 timestamp.
+
+    fromisoformat accepts a trailing "Z" on Python 3.11+, so the replace()
+    copy is only made on older interpreters.
+    """
     try:
-        # Get list fields to find Status and Owners fields
-        fields = affinity.get_list_fields(AFFINITY_LIST_ID)
-        status_field_id = None
-        owners_field_id = None
-        status_options = {}
-
-        for field in fields:
-            field_name = field.get("name", "").lower()
-            if field_name in ["status", "stage"]:
-                status_field_id = field.get("id")
-                for option in field.get("dropdown_options", []):
-                    status_options[option["id"]] = option["text"]
-            elif field_name == "owners":
-                owners_field_id = field.get("id")
+        return datetime.fromisoformat(ts)
+    except ValueError:
+        return datetime.fromisoformat(ts.replace('Z', '+00:00'))
+
+
+def _nudge_deal_for_entry(entry, status_field_id, status_options, owners_field_id, now):
+    """Fetch one list entry's field values and return its nudge record, or
+    None if the deal is within its stage threshold."""
+    entity_id = entry.get("entity_id")
+    created_at = entry.get("created_at")
+
+    # Get field values for this entry
+    field_values = affinity.get_list_entry_field_values(entry.get("id"))
+
+    current_status = None
+    status_updated_at = None
+    owners = []
+
+    for fv in field_values:
+        # Read field_id once; value/timestamps only for the two fields we use.
+        field_id = fv.get("field_id")
+        if field_id == status_field_id:
+            value = fv.get("value")
+            if isinstance(value, dict) and "text" in value:
+                current_status = value["text"]
+            elif isinstance(value, int) and value in status_options:
+                current_status = status_options[value]
+            status_updated_at = fv.get("updated_at") or fv.get("created_at")
+
+        elif field_id == owners_field_id:
+            # Owner field value is a person ID, need to resolve name
+            owner_value = fv.get("value")
+            if owner_value:
+                owners.append(owner_value)
+
+    # Check if this status needs a nudge
+    if not current_status or current_status not in STAGE_THRESHOLDS:
+        return None
+    threshold_days = STAGE_THRESHOLDS[current_status]
 
-        if not status_field_id:
-            logger.error("Could not find Status field")
-            return []
+    # Parse the date when status was set
+    status_date = None
+    if status_updated_at:
+        try:
+            status_date = _parse_iso(status_updated_at)
+        except (TypeError, ValueError):
+            pass
+    if status_date is None:
+        status_date = _parse_iso(created_at)
 
-        # Get all list entries
-        list_entries = affinity.get_list_entries(AFFINITY_LIST_ID)
+    days_in_stage = (now - status_date).days
+    if days_in_stage < threshold_days:
+        return None
 
-        deals_to_nudge = []
-        now = datetime.now(pytz.UTC)
+    # list-entries embeds the org record, so the name is usually already
+    # here; fetch the org only when it isn't.
+    org_name = (entry.get("entity") or {}).get("name")
+    if not org_name:
+        try:
+            org_name = affinity.get_organization(entity_id).get("name", "Unknown")
+        except Exception as e:
+            logger.error(f"Error getting org {entity_id}: {e}")
+            return None
 
-        for entry in list_entries:
-            entity_id = entry.get("entity_id")
-            list_entry_id = entry.get("id")
-            created_at = entry.get("created_at")
-
-            # Get field values for this entry
-            field_values = affinity.get_list_entry_field_values(list_entry_id)
-
-            current_status = None
-            status_updated_at = None
-            owners = []
-
-            for fv in field_values:
-                if fv.get("field_id") == status_field_id:
-                    value = fv.get("value")
-                    if isinstance(value, dict) and "text" in value:
-                        current_status = value["text"]
-                    elif isinstance(value, int) and value in status_options:
-                        current_status = status_options[value]
-                    status_updated_at = fv.get("updated_at") or fv.get("created_at")
-
-                elif fv.get("field_id") == owners_field_id:
-                    # Owner field value is a person ID, need to resolve name
-                    owner_value = fv.get("value")
-                    if owner_value:
-                        owners.append(owner_value)
-
-            # Check if this status needs a nudge
-            if current_status and current_status in STAGE_THRESHOLDS:
-                threshold_days = STAGE_THRESHOLDS[current_status]
-
-                # Parse the date when status was set
-                if status_updated_at:
-                    try:
-                        status_date = datetime.fromisoformat(status_updated_at.replace('Z', '+00:00'))
-                    except:
-                        status_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                else:
-                    status_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+    weeks_in_stage = days_in_stage // 7
+    week_text = f"{weeks_in_stage} week" + ("s" if weeks_in_stage != 1 else "")
 
-                days_in_stage = (now - status_date).days
+    return {
+        "org_id": entity_id,
+        "org_name": org_name,
+        "status": current_status,
+        "days_in_stage": days_in_stage,
+        "week_text": week_text,
+        "owners": owners,
+        "link": f"https://overture.affinity.co/companies/{entity_id}"
+    }
 
-                if days_in_stage >= threshold_days:
-                    # Get org details
-                    try:
-                        org = affinity.get_organization(entity_id)
-                        org_name = org.get("name", "Unknown")
 
-                        weeks_in_stage = days_in_stage // 7
-                        week_text = f"{weeks_in_stage} week" + ("s" if weeks_in_stage != 1 else "")
+def get_deals_needing_nudge():
+    """Get all deals that have been in a stage longer than the threshold."""
+    try:
+        status_field_id, status_options, owners_field_id = (
+            _resolve_nudge_schema(AFFINITY_LIST_ID)
+        )
 
-                        deals_to_nudge.append({
-                            "org_id": entity_id,
-                            "org_name": org_name,
-                            "status": current_status,
-                            "days_in_stage": days_in_stage,
-                            "week_text": week_text,
-                            "owners": owners,
-                            "link": f"https://overture.affinity.co/companies/{entity_id}"
-                        })
-                    except Exception as e:
-                        logger.error(f"Error getting org {entity_id}: {e}")
+        if not status_field_id:
+            logger.error("Could not find Status field")
+            return []
 
-        return deals_to_nudge
+        # Get all list entries
+        list_entries = affinity.get_list_entries(AFFINITY_LIST_ID)
+        now = datetime.now(_UTC)
+
+        def _check_entry(entry):
+            # Sweep requests yield the rate budget to live message lookups.
+            with affinity.background():
+                return _nudge_deal_for_entry(
+                    entry, status_field_id, status_options, owners_field_id, now
+                )
+
+        # Each entry runs its own field-values -> org chain, so a stale deal's
+        # org lookup starts as soon as its own values arrive instead of after
+        # the whole list. The client caps how many requests are in flight.
+        with ThreadPoolExecutor(max_workers=NUDGE_FETCH_WORKERS) as pool:
+            deals = pool.map(_check_entry, list_entries)
+            return [deal for deal in deals if deal is not None]
 
     except Exception as e:
         logger.error(f"Error getting deals needing nudge: {e}")
         return []
 
 
+@functools.lru_cache(maxsize=256)
+def _fetch_person_name(person_id):
+    """Look up a person's name in Affinity. Raises on failure, so errors
+    aren't memoized."""
+    person = affinity.get_person(person_id)
+    first_name = person.get("first_name", "")
+    last_name = person.get("last_name", "")
+    return f"{first_name} {last_name}".strip()
+
+
 def get_owner_name_from_id(person_id):
     """Get person name from Affinity person ID."""
+    name = AFFINITY_PERSON_TO_NAME.get(person_id)
+    if name:
+        return name
     try:
-        response = affinity.session.get(f"{AFFINITY_BASE_URL}/persons/{person_id}")
-        response.raise_for_status()
-        person = response.json()
-        first_name = person.get("first_name", "")
-        last_name = person.get("last_name", "")
-        return f"{first_name} {last_name}".strip()
+        return _fetch_person_name(person_id)
     except:
         return None
 
 
+# Slack rejects messages with more than 50 blocks
+NUDGE_BLOCKS_PER_MESSAGE = 50
+
+
+def _nudge_mention(deal):
+    """Return "<@U…> " for the deal's first owner, or "" if unmapped."""
+    if not deal["owners"]:
+        return ""
+    # Map the first owner straight to a Slack ID; only unknown
+    # person IDs need a name lookup.
+    slack_id = AFFINITY_PERSON_TO_SLACK.get(deal["owners"][0])
+    if not slack_id:
+        owner_name = get_owner_name_from_id(deal["owners"][0])
+        slack_id = OWNER_SLACK_MAP.get(owner_name)
+    return f"<@{slack_id}> " if slack_id else ""
+
+
 def send_nudge_messages():
-    """Check for deals needing nudges and send Slack messages."""
+    """Check for deals needing nudges and send Slack messages.
+
+    All nudges go out as one Block Kit message (one section per deal), split
+    only when there are more deals than Slack allows blocks per message.
+    """
     logger.info("Running nudge check...")
 
     if not NUDGE_CHANNEL_ID:
         logger.error("NUDGE_CHANNEL_ID not set")
         return
 
-    deals = get_deals_needing_nudge()
+    with affinity.background():
+        deals = get_deals_needing_nudge()
     logger.info(f"Found {len(deals)} deals needing nudges")
 
-    for deal in deals:
-        # Determine who to tag
-        slack_mention = ""
-
-        if deal["owners"]:
-            # Get first owner's name and map to Slack ID
-            owner_name = get_owner_name_from_id(deal["owners"][0])
-            if owner_name and owner_name in OWNER_SLACK_MAP:
-                slack_id = OWNER_SLACK_MAP[owner_name]
-                slack_mention = f"<@{slack_id}> "
-
-        message = f"{slack_mention}{deal['org_name']} has been in \"{deal['status']}\" for {deal['week_text']}. Link: {deal['link']}"
+    blocks = [
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"{_nudge_mention(deal)}{deal['org_name']} has been in \"{deal['status']}\" for {deal['week_text']}. Link: {deal['link']}",
+            },
+        }
+        for deal in deals
+    ]
 
+    for start in range(0, len(blocks), NUDGE_BLOCKS_PER_MESSAGE):
+        batch = deals[start:start + NUDGE_BLOCKS_PER_MESSAGE]
         try:
             app.client.chat_postMessage(
                 channel=NUDGE_CHANNEL_ID,
-                text=message
+                blocks=blocks[start:start + NUDGE_BLOCKS_PER_MESSAGE],
+                text="Weekly deal nudges",
             )
-            logger.info(f"Sent nudge for {deal['org_name']}")
+            logger.info(f"Sent nudges for {', '.join(d['org_name'] for d in batch)}")
         except Exception as e:
-            logger.error(f"Error sending nudge for {deal['org_name']}: {e}")
+            logger.error(f"Error sending nudges for {', '.join(d['org_name'] for d in batch)}: {e}")
+
+
+NUDGE_TZ = ZoneInfo('America/Los_Angeles')
+NUDGE_WEEKDAY = 1  # Tuesday (Monday == 0)
+NUDGE_HOUR = 9
+
+
+def _next_nudge_run(now=None):
+    """Return the next Tuesday 9am PT strictly after `now` (aware datetime)."""
+    now = (now or datetime.now(NUDGE_TZ)).astimezone(NUDGE_TZ)
+    day = now.date() + timedelta(days=(NUDGE_WEEKDAY - now.weekday()) % 7)
+    run_at = datetime(day.year, day.month, day.day, NUDGE_HOUR, tzinfo=NUDGE_TZ)
+    if run_at <= now:
+        day += timedelta(days=7)
+        run_at = datetime(day.year, day.month, day.day, NUDGE_HOUR, tzinfo=NUDGE_TZ)
+    return run_at
 
 
 def run_scheduler():
     """Run the scheduler in a separate thread."""
-    # Schedule nudge check at 9am PT on Tuesdays
-    pacific = pytz.timezone('America/Los_Angeles')
-    schedule.every().tuesday.at("09:00").do(send_nudge_messages)
-
     logger.info("Scheduler started - nudges will run Tuesdays at 9am PT")
 
     while True:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute
+        # Sleep straight through to the next run instead of polling; the
+        # target is recomputed each week so DST shifts are handled. The
+        # remaining time is measured against UTC: subtracting two datetimes
+        # that share a zoneinfo tz is wall-clock arithmetic and would be an
+        # hour off across a DST change.
+        run_at = _next_nudge_run()
+        logger.info(f"Next nudge check at {run_at.isoformat()}")
+        remaining = (run_at - datetime.now(_UTC)).total_seconds()
+        while remaining > 0:
+            time.sleep(remaining)
+            remaining = (run_at - datetime.now(_UTC)).total_seconds()
+
+        try:
+            send_nudge_messages()
+        except Exception as e:
+            logger.error(f"Error running scheduled nudge check: {e}")
+
+
+DEALFLOW_CHANNEL_NAME = "dealflow"
+
+# Channel ID -> name, resolved once per channel with conversations_info and
+# then answered from memory. Rename events keep it current.
+_channel_names = {}
+
+
+def _get_channel_name(client, channel_id):
+    """Return the channel's name, calling Slack only the first time an ID is seen.
+
+    DMs have no name and resolve to None.
+    """
+    if channel_id not in _channel_names:
+        channel_info = client.conversations_info(channel=channel_id)
+        _channel_names[channel_id] = channel_info["channel"].get("name")
+    return _channel_names[channel_id]
+
+
+@app.event("channel_rename")
+@app.event("group_rename")
+def handle_channel_rename(event):
+    """Keep the channel-name cache in step with renames."""
+    channel = event.get("channel") or {}
+    if channel.get("id"):
+        _channel_names[channel["id"]] = channel.get("name")
 
 
 @app.event("message")
@@ -1996,41 +2658,54 @@ def handle_message(event, say, client):
     # Check for manual nudge test command
     if text.lower() == "!nudge-test":
         say(text="🔄 Running nudge check...")
-        send_nudge_messages()
-        say(text="✅ Nudge check complete!")
+
+        def _run_nudge_test():
+            send_nudge_messages()
+            say(text="✅ Nudge check complete!")
+
+        # The sweep touches every list entry; run it on its own thread so it
+        # doesn't hold a listener worker for the whole run.
+        threading.Thread(target=_run_nudge_test, name="nudge-test", daemon=True).start()
         return
 
-    try:
-        channel_info = client.conversations_info(channel=channel_id)
-        channel_name = channel_info["channel"]["name"]
+    if not text:
+        return
+
+    # DMs and group DMs can never be #dealflow — no lookup needed. A dict
+    # read, so it goes ahead of the text heuristics below.
+    if event.get("channel_type") in ("im", "mpim"):
+        return
+
+    # Cheap reject before any Slack or Affinity call: with no link in the
+    # message the only route left is the company-name poll below, which would
+    # turn this text away anyway. Keeps chatter from costing an API round-trip.
+    if "://" not in text and not _looks_like_company_name(text):
+        return
 
-        if channel_name != "dealflow":
+    try:
+        if _get_channel_name(client, channel_id) != DEALFLOW_CHANNEL_NAME:
             return
     except Exception as e:
         logger.error(f"Error getting channel info: {e}")
         return
 
-    if not text:
-        return
-
     user_id = event.get("user")
 
-    # Check if this is a "missed" deal BEFORE branching
-    missed_pattern = r'\b(missed|miss|missing)\b'
-    is_missed = bool(re.search(missed_pattern, text.lower()))
-
     # --- LinkedIn pre-check ---
     # Priority rule: if the message also contains a NON-LinkedIn URL, that URL wins as the
     # company domain; the LinkedIn URL is saved as a note. Only if there is no real URL do we
     # route to the dedicated LinkedIn handlers (person lead, or company-name poll).
-    linkedin_info = extract_linkedin_info(text)
+    # Every LinkedIn pattern needs a scheme, so plain text skips the lookup.
+    linkedin_info = extract_linkedin_info(text) if "://" in text else None
     linkedin_url_to_attach = None
+    text_without_linkedin = strip_linkedin_urls(text) if linkedin_info else text
 
-    if linkedin_info:
-        text_without_linkedin = strip_linkedin_urls(text)
-        has_other_url = bool(re.search(r'https?://[^\s]+', text_without_linkedin))
+    # One scan of the (LinkedIn-stripped) text answers every routing question
+    # below: other link present, "missed" deal, and the company name/domain.
+    has_url, is_missed, company_name, domain = analyze_message(text_without_linkedin)
 
-        if has_other_url:
+    if linkedin_info:
+        if has_url:
             # Real URL takes priority — strip LinkedIn, keep it as a note, fall through.
             linkedin_url_to_attach = linkedin_info["url"]
             text = text_without_linkedin
@@ -2057,11 +2732,8 @@ def handle_message(event, say, client):
             text = text_without_linkedin
 
     # --- Branch 1: message contains a (non-LinkedIn) URL ---
-    url_pattern = r'https?://[^\s]+'
-    if re.search(url_pattern, text):
+    if has_url:
         logger.info(f"Processing message with URL: {text} (is_missed: {is_missed})")
-
-        company_name, domain = extract_company_info(text)
         logger.info(f"Extracted - Name: {company_name}, Domain: {domain}")
 
         if not company_name and not domain:
@@ -2132,7 +2804,7 @@ def handle_url_pick(ack, body, client):
         linkedin_url = payload.get("linkedin_url")
 
         # Extract domain from the URL
-        m = re.search(r"https?://(?:www\.)?([^/]+)", url)
+        m = _URL_HOST_RE.search(url)
         domain = m.group(1) if m else url
         # Use seed as company name fallback
         company_name = payload.get("name") or seed or domain.split(".")[0].title()
@@ -2296,9 +2968,9 @@ def handle_url_reply_later_submit(ack, body, client):
 
         # Auto-prepend https:// if missing; validate very loosely.
         url = url_raw
-        if url and not re.match(r"^https?://", url, re.IGNORECASE):
+        if url and not _URL_SCHEME_RE.match(url):
             url = f"https://{url}"
-        if not url or not re.match(r"^https?://[^\s]+\.[^\s]+", url, re.IGNORECASE):
+        if not url or not _LOOSE_URL_RE.match(url):
             # Return an error and keep the modal open so the user can fix.
             ack(response_action="errors", errors={"url_block": "Please enter a valid URL (e.g., https://example.com)."})
             return
@@ -2314,7 +2986,7 @@ def handle_url_reply_later_submit(ack, body, client):
         seed = meta.get("seed", "")
         linkedin_url = meta.get("linkedin_url")
 
-        m = re.search(r"https?://(?:www\.)?([^/]+)", url)
+        m = _URL_HOST_RE.search(url)
         domain = m.group(1) if m else url
         company_name = name or seed or domain.split(".")[0].title()
 
@@ -2362,6 +3034,6 @@ if __name__ == "__main__":
     scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
     scheduler_thread.start()
 
-    handler = SocketModeHandler(app, SLACK_APP_TOKEN)
+    handler = SocketModeHandler(app, SLACK_APP_TOKEN, concurrency=SLACK_LISTENER_WORKERS)
     logger.info("Starting Slack bot with nudge scheduler...")
     handler.start()